@@ -1,18 +1,182 @@
 #!/usr/bin/env python3
+import collections
+import contextlib
+import fcntl
+import functools
+import gzip
+import hashlib
 import subprocess
 import json
 import time
 import tempfile
+import threading
 import os
+import pwd
 from datetime import datetime, timedelta
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
 import re
 
+try:
+    # Optional: orjson serializes straight to bytes and is several times faster
+    from orjson import dumps as json_dumps
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    # Optional: compiles the next-run walk; startup stays fast without it
+    import numba
+except ImportError:
+    numba = None
+
+# Shapes a cron field can take; the index of the matching group gives its kind
+_FIELD_RE = re.compile(
+    r'(\*)$'              # 1: any value
+    r'|\*/(\d+)$'         # 2: every n
+    r'|([^/]+)/(\d+)$'    # 4: every n starting at a value
+    r'|(.*,.*)$'          # 5: list of values
+    r'|(\d+)-(\d+)$'      # 7: range
+    r'|(.+)$'             # 8: single value
+)
+_FIELD_KINDS = (None, 'any', 'step', None, 'start_step', 'list', None, 'range', 'value')
+
+# Descriptions for schedules common enough to deserve hand-written wording
+_COMMON_PATTERNS = {
+    '* * * * *': 'Every minute',
+    '0 * * * *': 'Every hour',
+    '0 0 * * *': 'Daily at midnight',
+    '0 12 * * *': 'Daily at noon',
+    '0 9 * * 1': 'Every Monday at 9 AM',
+    '0 0 1 * *': 'First day of every month',
+    '0 0 1 1 *': 'Every New Year (January 1st)',
+    '*/5 * * * *': 'Every 5 minutes',
+    '*/15 * * * *': 'Every 15 minutes',
+    '*/30 * * * *': 'Every 30 minutes',
+    '0 */6 * * *': 'Every 6 hours',
+    '0 2 * * *': 'Daily at 2 AM',
+    '0 0 * * 0': 'Every Sunday at midnight',
+    '0 0 * * 1-5': 'Weekdays at midnight',
+    '30 2 * * 1-5': 'Weekdays at 2:30 AM'
+}
+
+_MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_WEEKDAY_NAMES = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
+# Names cron accepts in place of numbers (case-insensitive) in the month and weekday fields
+_MONTH_NUMBERS = {name.lower(): i for i, name in enumerate(_MONTH_NAMES, 1)}
+_WEEKDAY_NUMBERS = {name[:3].lower(): i for i, name in enumerate(_WEEKDAY_NAMES)}
+
+def _field_number(value, names=None):
+    """Convert a field value to an int, accepting names from the given table"""
+    if names:
+        number = names.get(value.lower())
+        if number is not None:
+            return number
+    # int() would also take '+5', '1_2' and non-ASCII digits, none of which cron accepts
+    if not (value.isascii() and value.isdigit()):
+        raise ValueError(f'Invalid value "{value}"')
+    return int(value)
+
+def _named_values(field, names):
+    """Numbers of the plain values and names listed in a field, skipping anything else"""
+    numbers = []
+    for value in field.split(','):
+        try:
+            numbers.append(_field_number(value, names))
+        except ValueError:
+            pass
+    return numbers
+
 class CronPreview:
+    # Explanation fragments per field and kind of field value
+    _EXPLANATIONS = {
+        'minute': {
+            'any': 'every minute',
+            'step': 'every {0} minutes',
+            'start_step': 'every {1} minutes starting at minute {0}',
+            'list': 'at minutes {0}',
+            'range': 'from minute {0} to {1}',
+            'value': 'at minute {0}'
+        },
+        'hour': {
+            'any': None,
+            'step': 'every {0} hours',
+            'start_step': 'every {1} hours starting at hour {0}',
+            'list': 'at hours {0}',
+            'range': 'from hour {0} to {1}',
+            'value': 'at {0}:XX'
+        },
+        'day': {
+            'any': None,
+            'step': 'every {0} days',
+            'start_step': 'every {1} days',
+            'list': 'on days {0}',
+            'range': 'from day {0} to {1}',
+            'value': 'on day {0}'
+        }
+    }
+
+    # Breakdown wording per kind of field value
+    _BREAKDOWNS = {
+        'any': 'Any {name}',
+        'step': 'Every {0} {name}s',
+        'start_step': 'Every {1} {name}s starting from {0}',
+        'list': '{name}s: {0}',
+        'range': '{name}s from {0} to {1}',
+        'value': '{name} {0}'
+    }
+
+    # A parse is assembled from three caches: _describe (per expression),
+    # _next_runs (per expression and minute) and _compiled_masks (per fields)
+
+    @staticmethod
+    def parse_cron(expression, minute_bucket=None):
+        """Enhanced cron parser with detailed explanations
+
+        The breakdown and next runs in the result are shared with the caches
+        and must not be modified by callers. Pass minute_bucket (epoch
+        minutes) to evaluate many expressions against the same clock reading.
+        """
+        if minute_bucket is None:
+            minute_bucket = int(time.time() // 60)
+        info = CronPreview._describe(expression)
+        if not info['valid']:
+            return info
+        return {**info, 'next_runs': CronPreview._next_runs(expression, minute_bucket)}
+
+    @staticmethod
+    def parse_cron_brief(expression, minute_bucket=None):
+        """Only the description and next runs, which is all the jobs list shows
+
+        Common patterns are answered from the pattern table without building
+        the explanation and breakdown.
+        """
+        if minute_bucket is None:
+            minute_bucket = int(time.time() // 60)
+        description = _COMMON_PATTERNS.get(expression)
+        if description is None:
+            return CronPreview.parse_cron(expression, minute_bucket)
+        return {
+            'description': description,
+            'next_runs': CronPreview._next_runs(expression, minute_bucket)
+        }
+
     @staticmethod
-    def parse_cron(expression):
-        """Enhanced cron parser with detailed explanations"""
+    @functools.lru_cache(maxsize=512)
+    def _next_runs(expression, minute_bucket, count=5):
+        """Next runs after the given minute, computed once per expression and minute
+
+        Shared by the full and brief parses; the returned list must not be modified.
+        """
+        now = datetime.fromtimestamp(minute_bucket * 60)
+        return CronPreview.calculate_next_runs(expression.strip().split(), count, now=now)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _describe(expression):
+        """The parts of a parse that do not depend on the clock"""
         try:
             parts = expression.strip().split()
             if len(parts) != 5:
@@ -24,83 +188,47 @@ class CronPreview:
                 }
             
             minute, hour, day, month, weekday = parts
+            masks, error = CronPreview._compiled_masks(tuple(parts))
+            if masks is None:
+                return {
+                    'valid': False,
+                    'description': 'Error parsing cron expression',
+                    'next_runs': [],
+                    'explanation': error
+                }
             
             # Generate detailed explanation
             explanation_parts = []
-            
-            # Minute explanation
-            if minute == '*':
-                explanation_parts.append('every minute')
-            elif '/' in minute:
-                if minute.startswith('*/'):
-                    explanation_parts.append(f'every {minute[2:]} minutes')
-                else:
-                    explanation_parts.append(f'every {minute.split("/")[1]} minutes starting at minute {minute.split("/")[0]}')
-            elif ',' in minute:
-                explanation_parts.append(f'at minutes {minute}')
-            elif '-' in minute:
-                start, end = minute.split('-')
-                explanation_parts.append(f'from minute {start} to {end}')
-            else:
-                explanation_parts.append(f'at minute {minute}')
-            
-            # Hour explanation
-            if hour != '*':
-                if '/' in hour:
-                    if hour.startswith('*/'):
-                        explanation_parts.append(f'every {hour[2:]} hours')
-                    else:
-                        explanation_parts.append(f'every {hour.split("/")[1]} hours starting at hour {hour.split("/")[0]}')
-                elif ',' in hour:
-                    explanation_parts.append(f'at hours {hour}')
-                elif '-' in hour:
-                    start, end = hour.split('-')
-                    explanation_parts.append(f'from hour {start} to {end}')
-                else:
-                    explanation_parts.append(f'at {hour}:XX')
-            
-            # Day explanation
-            if day != '*':
-                if '/' in day:
-                    explanation_parts.append(f'every {day.split("/")[1]} days')
-                elif ',' in day:
-                    explanation_parts.append(f'on days {day}')
-                elif '-' in day:
-                    start, end = day.split('-')
-                    explanation_parts.append(f'from day {start} to {end}')
-                else:
-                    explanation_parts.append(f'on day {day}')
+            for field, field_name in ((minute, 'minute'), (hour, 'hour'), (day, 'day')):
+                kind, values = CronPreview._match_field(field)
+                template = CronPreview._EXPLANATIONS[field_name][kind]
+                if template:
+                    explanation_parts.append(template.format(*values))
             
             # Month explanation
-            if month != '*':
-                months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                         'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                if month.isdigit() and 1 <= int(month) <= 12:
-                    explanation_parts.append(f'in {months[int(month)-1]}')
-                elif ',' in month:
-                    month_names = [months[int(m)-1] for m in month.split(',') if m.isdigit() and 1 <= int(m) <= 12]
+            kind, values = CronPreview._match_field(month)
+            if kind in ('value', 'list'):
+                month_names = [_MONTH_NAMES[m - 1] for m in _named_values(values[0], _MONTH_NUMBERS)]
+                if month_names:
                     explanation_parts.append(f'in {", ".join(month_names)}')
             
             # Weekday explanation
-            if weekday != '*':
-                days = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-                if weekday.isdigit() and 0 <= int(weekday) <= 6:
-                    explanation_parts.append(f'on {days[int(weekday)]}')
-                elif ',' in weekday:
-                    day_names = [days[int(d)] for d in weekday.split(',') if d.isdigit() and 0 <= int(d) <= 6]
+            kind, values = CronPreview._match_field(weekday)
+            if kind in ('value', 'list'):
+                day_names = [_WEEKDAY_NAMES[d % 7] for d in _named_values(values[0], _WEEKDAY_NUMBERS)]
+                if day_names:
                     explanation_parts.append(f'on {", ".join(day_names)}')
             
-            # Generate human-readable description
-            description = CronPreview.get_common_patterns(expression) or " ".join(explanation_parts).capitalize()
-            
-            # Calculate next runs
-            next_runs = CronPreview.calculate_next_runs(parts)
+            # Generate human-readable description; only the first letter is
+            # upper-cased since str.capitalize() would turn "2:XX" into "2:xx"
+            explanation = " ".join(explanation_parts)
+            explanation = explanation[:1].upper() + explanation[1:]
+            description = CronPreview.get_common_patterns(expression) or explanation
             
             return {
                 'valid': True,
                 'description': description,
-                'next_runs': next_runs,
-                'explanation': " ".join(explanation_parts).capitalize(),
+                'explanation': explanation,
                 'breakdown': {
                     'minute': CronPreview.explain_field(minute, 'minute', 0, 59),
                     'hour': CronPreview.explain_field(hour, 'hour', 0, 23),
@@ -121,209 +249,676 @@ class CronPreview:
     @staticmethod
     def get_common_patterns(expression):
         """Recognize common cron patterns"""
-        patterns = {
-            '* * * * *': 'Every minute',
-            '0 * * * *': 'Every hour',
-            '0 0 * * *': 'Daily at midnight',
-            '0 12 * * *': 'Daily at noon',
-            '0 9 * * 1': 'Every Monday at 9 AM',
-            '0 0 1 * *': 'First day of every month',
-            '0 0 1 1 *': 'Every New Year (January 1st)',
-            '*/5 * * * *': 'Every 5 minutes',
-            '*/15 * * * *': 'Every 15 minutes',
-            '*/30 * * * *': 'Every 30 minutes',
-            '0 */6 * * *': 'Every 6 hours',
-            '0 2 * * *': 'Daily at 2 AM',
-            '0 0 * * 0': 'Every Sunday at midnight',
-            '0 0 * * 1-5': 'Weekdays at midnight',
-            '30 2 * * 1-5': 'Weekdays at 2:30 AM'
-        }
-        return patterns.get(expression)
+        return _COMMON_PATTERNS.get(expression)
     
+    @staticmethod
+    def _match_field(field):
+        """Classify a field with a single regex match, returning (kind, values)"""
+        match = _FIELD_RE.match(field)
+        return _FIELD_KINDS[match.lastindex], [g for g in match.groups() if g is not None]
+
     @staticmethod
     def explain_field(field, field_name, min_val, max_val):
         """Explain individual cron field"""
-        if field == '*':
-            return f'Any {field_name}'
-        elif '/' in field:
-            if field.startswith('*/'):
-                return f'Every {field[2:]} {field_name}s'
-            else:
-                parts = field.split('/')
-                return f'Every {parts[1]} {field_name}s starting from {parts[0]}'
-        elif ',' in field:
-            return f'{field_name}s: {field}'
-        elif '-' in field:
-            start, end = field.split('-')
-            return f'{field_name}s from {start} to {end}'
-        else:
-            return f'{field_name} {field}'
+        kind, values = CronPreview._match_field(field)
+        return CronPreview._BREAKDOWNS[kind].format(*values, name=field_name)
     
     @staticmethod
-    def calculate_next_runs(parts, count=5):
-        """Calculate next run times (simplified implementation)"""
+    def _compile_field(field, min_val, max_val, names=None):
+        """Compile a cron field into a bitmask (bit i set if value i is allowed)"""
+        mask = 0
+        for part in field.split(','):
+            value, _, step = part.partition('/')
+            if value == '*':
+                start, end = min_val, max_val
+            elif '-' in value:
+                start, end = (_field_number(v, names) for v in value.split('-', 1))
+            else:
+                start = _field_number(value, names)
+                end = max_val if step else start
+            step = _field_number(step) if step else 1
+            if step < 1 or start < min_val or end > max_val or start > end:
+                raise ValueError(f'Invalid field "{field}" (allowed {min_val}-{max_val})')
+            for i in range(start, end + 1, step):
+                mask |= 1 << i
+        return mask
+
+    @staticmethod
+    def compile_masks(parts):
+        """Compile the five cron fields into (minute, hour, day, month, weekday) bitmasks"""
         minute, hour, day, month, weekday = parts
-        now = datetime.now()
-        next_runs = []
-        
+        weekday_mask = CronPreview._compile_field(weekday, 0, 7, _WEEKDAY_NUMBERS)
+        if weekday_mask & (1 << 7):
+            # 7 is an alias for Sunday
+            weekday_mask = (weekday_mask | 1) & 0x7F
+        return (
+            CronPreview._compile_field(minute, 0, 59),
+            CronPreview._compile_field(hour, 0, 23),
+            CronPreview._compile_field(day, 1, 31),
+            CronPreview._compile_field(month, 1, 12, _MONTH_NUMBERS),
+            weekday_mask
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compiled_masks(parts):
+        """compile_masks cached per tuple of fields, as (masks, None) or (None, error)"""
         try:
-            # Simple calculation for common patterns
-            if parts == ['*', '*', '*', '*', '*']:
-                # Every minute
-                for i in range(count):
-                    next_run = now + timedelta(minutes=i+1)
-                    next_runs.append(next_run.strftime("%Y-%m-%d %H:%M"))
-            
-            elif minute.startswith('*/') and hour == '*':
-                # Every X minutes
-                interval = int(minute[2:])
-                for i in range(count):
-                    next_run = now + timedelta(minutes=interval * (i+1))
-                    next_runs.append(next_run.strftime("%Y-%m-%d %H:%M"))
-            
-            elif minute.isdigit() and hour.isdigit():
-                # Specific time daily
-                target_hour = int(hour)
-                target_minute = int(minute)
-                
-                next_run = now.replace(hour=target_hour, minute=target_minute, second=0, microsecond=0)
-                for i in range(count):
-                    if next_run <= now:
-                        next_run += timedelta(days=1)
-                    next_runs.append(next_run.strftime("%Y-%m-%d %H:%M"))
-                    next_run += timedelta(days=1)
-            
-            elif minute == '0' and hour == '*':
-                # Every hour
-                next_run = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
-                for i in range(count):
-                    next_runs.append(next_run.strftime("%Y-%m-%d %H:%M"))
-                    next_run += timedelta(hours=1)
-            
-            else:
-                # Generic fallback
-                for i in range(count):
-                    next_run = now + timedelta(hours=i+1)
-                    next_runs.append(next_run.strftime("%Y-%m-%d %H:%M"))
-            
-        except Exception:
+            return CronPreview.compile_masks(parts), None
+        except ValueError as e:
+            return None, str(e)
+
+    @staticmethod
+    def calculate_next_runs(parts, count=5, masks=None, now=None):
+        """Calculate next run times by walking the compiled field bitmasks
+
+        All count runs come out of a single walk over the masks.
+        """
+        if masks is None:
+            masks, _ = CronPreview._compiled_masks(tuple(parts))
+            if masks is None:
+                return []
+
+        # Like cron, a restricted day and weekday match if either one does
+        match_either = not parts[2].startswith('*') and not parts[4].startswith('*')
+
+        start = (now or datetime.now()).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        runs = _next_run_from_masks(*masks, match_either, start.year, start.month, start.day,
+                                    start.hour, start.minute, count)
+
+        return [_format_run(run) for run in runs]
+
+def _format_run(run):
+    """Format a YYYYMMDDHHMM integer as 'YYYY-MM-DD HH:MM' without strftime"""
+    date, time_of_day = divmod(run, 10000)
+    year, month_day = divmod(date, 10000)
+    hour, minute = divmod(time_of_day, 100)
+    return f"{year:04d}-{month_day // 100:02d}-{month_day % 100:02d} {hour:02d}:{minute:02d}"
+
+# The next-run walk below sticks to plain integer arithmetic so that numba,
+# when installed, can compile it to native code.
+
+def _next_bit(mask, value):
+    """Return the lowest allowed value >= value, or -1 if there is none"""
+    rest = mask >> value
+    if not rest:
+        return -1
+    return value + (rest & -rest).bit_length() - 1
+
+def _next_bit_scan(mask, value):
+    """_next_bit without int.bit_length, which numba does not support"""
+    while value < 64:
+        if (mask >> value) & 1:
+            return value
+        value += 1
+    return -1
+
+def _days_in_month(year, month):
+    if month == 2:
+        return 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
+    return 30 if month in (4, 6, 9, 11) else 31
+
+def _weekday(year, month, day):
+    """Day of week with Sunday as 0 (Sakamoto's method)"""
+    offsets = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+    if month < 3:
+        year -= 1
+    return (year + year // 4 - year // 100 + year // 400 + offsets[month - 1] + day) % 7
+
+def _days_mask(year, month, day_mask, weekday_mask, match_either):
+    """Bitmask of the days in a month matching the day and weekday fields"""
+    first_weekday = _weekday(year, month, 1)
+    week = 0
+    for i in range(7):
+        if (weekday_mask >> ((first_weekday + i) % 7)) & 1:
+            week |= 1 << i
+    weekday_days = 0
+    for offset in range(1, 32, 7):
+        weekday_days |= week << offset
+    month_days = (1 << (_days_in_month(year, month) + 1)) - 2
+    if match_either:
+        return (day_mask | weekday_days) & month_days
+    return day_mask & weekday_days & month_days
+
+def _next_run_from_masks(minute_mask, hour_mask, day_mask, month_mask, weekday_mask,
+                         match_either, year, month, day, hour, minute, count):
+    """Return up to count runs at or after the given time as YYYYMMDDHHMM integers"""
+    last_year = year + 28
+    runs = []
+
+    while len(runs) < count and year <= last_year:
+        next_month = _next_bit(month_mask, month)
+        if next_month < 0:
+            year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+            continue
+        if next_month != month:
+            month, day, hour, minute = next_month, 1, 0, 0
+
+        days = _days_mask(year, month, day_mask, weekday_mask, match_either)
+        next_day = _next_bit(days, day)
+        if next_day < 0:
+            month, day, hour, minute = month + 1, 1, 0, 0
+            continue
+        if next_day != day:
+            day, hour, minute = next_day, 0, 0
+
+        next_hour = _next_bit(hour_mask, hour)
+        if next_hour < 0:
+            day, hour, minute = day + 1, 0, 0
+            continue
+        if next_hour != hour:
+            hour, minute = next_hour, 0
+
+        next_minute = _next_bit(minute_mask, minute)
+        if next_minute < 0:
+            hour, minute = hour + 1, 0
+            continue
+
+        runs.append(((year * 100 + month) * 100 + day) * 10000 + hour * 100 + next_minute)
+        minute = next_minute + 1
+
+    return runs
+
+if numba is not None:
+    # Rebinding the helpers first makes the compiled walk call compiled code
+    _next_bit = numba.njit(cache=True)(_next_bit_scan)
+    _days_in_month = numba.njit(cache=True)(_days_in_month)
+    _weekday = numba.njit(cache=True)(_weekday)
+    _days_mask = numba.njit(cache=True)(_days_mask)
+    _next_run_from_masks = numba.njit(cache=True)(_next_run_from_masks)
+
+# Where cron keeps per-user crontabs: Debian/Raspberry Pi OS, cronie
+# (Fedora, Arch), then the BSDs. Usually readable by root only.
+CRONTAB_SPOOL_DIRS = ('/var/spool/cron/crontabs', '/var/spool/cron', '/var/cron/tabs')
+
+# One match per crontab line: a comment (1), a job (2) with its five schedule
+# fields (3-7) and command (8), or anything else (blank lines, variables)
+_CRONTAB_RE = re.compile(
+    rb'^[ \t]*(?:#[ \t]*(.*?)'
+    rb'|((\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)(?:[ \t]+(.*?))?)'
+    rb'|.*?)[ \t]*$',
+    re.M
+)
+
+# Parsed crontab entries, keyed on the spool file's st_mtime_ns, or kept for
+# CRONTAB_CACHE_TTL seconds when the crontab has to come from `crontab -l`.
+# generation is bumped by every write, so a read that overlapped one is not cached.
+_CRONTAB_CACHE = {'mtime': None, 'expires': 0, 'entries': None, 'generation': 0}
+CRONTAB_CACHE_TTL = 10
+
+# The jobs payload last built by get_cron_jobs, with the entries and minute it was built for
+_JOBS_CACHE = {'entries': None, 'minute_bucket': None, 'jobs': None}
+
+# Most buffers a single os.writev call accepts
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if 'SC_IOV_MAX' in os.sysconf_names else 1024
+
+# Guards _CRONTAB_CACHE and _JOBS_CACHE, and serializes read-modify-write edits of the crontab
+_CRONTAB_LOCK = threading.RLock()
+
+@functools.lru_cache(maxsize=None)
+def _crontab_spool_dir():
+    """This system's crontab spool directory, or None if there is none (probed once)"""
+    for path in CRONTAB_SPOOL_DIRS:
+        if os.path.isdir(path):
+            return path
+    return None
+
+def _crontab_path():
+    """Spool file of the current user's crontab"""
+    return os.path.join(_crontab_spool_dir(), pwd.getpwuid(os.getuid()).pw_name)
+
+def _crontab_mtime():
+    """Modification stamp of the spool file, 0 if there is no crontab, None if unreadable"""
+    if _crontab_spool_dir() is None:
+        return None
+    try:
+        return os.stat(_crontab_path()).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    except OSError:
+        return None
+
+def read_crontab():
+    """Return the raw bytes and mtime of the current user's crontab
+
+    The spool file is read directly when permitted, otherwise this falls
+    back to ``crontab -l`` and mtime is None.
+    """
+    if _crontab_mtime() is not None:
+        try:
+            with open(_crontab_path(), 'rb') as f:
+                mtime = os.fstat(f.fileno()).st_mtime_ns
+                data = f.read()
+            if data.startswith(b'# DO NOT EDIT THIS FILE'):
+                # Skip the header `crontab` writes, as `crontab -l` does
+                data = data.split(b'\n', 3)[-1]
+            return data, mtime
+        except FileNotFoundError:
+            return b'', 0
+        except OSError:
             pass
+
+    try:
+        result = subprocess.run(['crontab', '-l'], capture_output=True, check=True)
+        return result.stdout, None
+    except (subprocess.CalledProcessError, OSError):
+        return b'', None
+
+def read_crontab_entries():
+    """Return the crontab's jobs as (schedule, command, comment, line) tuples"""
+    mtime = _crontab_mtime()
+    now = time.monotonic()
+    with _CRONTAB_LOCK:
+        if mtime is not None and mtime == _CRONTAB_CACHE['mtime']:
+            return _CRONTAB_CACHE['entries']
+        if mtime is None and now < _CRONTAB_CACHE['expires']:
+            return _CRONTAB_CACHE['entries']
+        generation = _CRONTAB_CACHE['generation']
+
+    data, mtime = read_crontab()
+    entries = []
+    comment = b""
+    for m in _CRONTAB_RE.finditer(data):
+        if m.group(1) is not None:
+            comment = m.group(1)
+            continue
+        if m.group(2) is not None:
+            # Only the rows we keep are decoded
+            schedule = b' '.join(m.group(3, 4, 5, 6, 7)).decode('ascii', 'replace')
+            entries.append((
+                schedule,
+                (m.group(8) or b'').decode('utf-8', 'replace'),
+                comment.decode('utf-8', 'replace'),
+                m.group(2).decode('utf-8', 'replace')
+            ))
+        comment = b""
+
+    expires = now + CRONTAB_CACHE_TTL if mtime is None else 0
+    with _CRONTAB_LOCK:
+        # The crontab may have been rewritten while we were reading it
+        if _CRONTAB_CACHE['generation'] == generation:
+            _CRONTAB_CACHE.update(mtime=mtime, expires=expires, entries=entries)
+    return entries
+
+def _write_lines(fd, lines):
+    """Write newline-terminated byte lines to fd with os.writev, avoiding one big join"""
+    buffers = []
+    for line in lines:
+        buffers.append(line)
+        buffers.append(b'\n')
+    for i in range(0, len(buffers), _IOV_MAX):
+        batch = buffers[i:i + _IOV_MAX]
+        written = os.writev(fd, batch)
+        if written < sum(map(len, batch)):
+            rest = b''.join(batch)[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
+
+def _spool_writable():
+    """Whether the crontab can be rewritten in the spool directly (i.e. running as root)"""
+    return _crontab_mtime() is not None and os.access(_crontab_spool_dir(), os.W_OK)
+
+@contextlib.contextmanager
+def crontab_edit_lock():
+    """Serialize a read-modify-write of the crontab
+
+    Threads are serialized by _CRONTAB_LOCK. When the spool is written
+    directly, an flock on a dot file beside the crontab also serializes
+    concurrent instances of this server. Nothing else takes that lock, so
+    it does not protect against ``crontab -e`` or ``crontab <file>``.
+    """
+    with _CRONTAB_LOCK:
+        if not _spool_writable():
+            yield
+            return
+        # cron ignores dot files, so the lock file is never read as a crontab
+        spool_dir, user = os.path.split(_crontab_path())
+        fd = os.open(os.path.join(spool_dir, f'.{user}.lock'), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # Closing the descriptor releases the lock
+            os.close(fd)
+
+def write_crontab(lines, direct=True):
+    """Install lines (bytes, without newlines) as the current user's crontab
+
+    Writes the spool file in place when the spool directory is writable
+    (i.e. running as root), otherwise installs it through ``crontab``.
+    Pass direct=False for lines that have not been validated, so that
+    ``crontab`` checks their syntax before installing them.
+    """
+    try:
+        if direct and _spool_writable():
+            spool_dir = _crontab_spool_dir()
+            path = _crontab_path()
+            # cron ignores dot files, so the temp file is never picked up as a crontab
+            fd, temp_file = tempfile.mkstemp(prefix='.', suffix='.cron', dir=spool_dir)
+            try:
+                try:
+                    _write_lines(fd, lines)
+                    if os.path.exists(path):
+                        st = os.stat(path)
+                        os.fchown(fd, st.st_uid, st.st_gid)
+                finally:
+                    os.close(fd)
+                # Replacing the file bumps the spool dir mtime, which makes cron reload
+                os.replace(temp_file, path)
+            except OSError:
+                os.unlink(temp_file)
+                raise
+            return
+
+        fd, temp_file = tempfile.mkstemp(suffix='.cron')
+        try:
+            try:
+                _write_lines(fd, lines)
+            finally:
+                os.close(fd)
+            subprocess.run(['crontab', temp_file], check=True)
+        finally:
+            os.unlink(temp_file)
+    finally:
+        with _CRONTAB_LOCK:
+            _CRONTAB_CACHE.update(mtime=None, expires=0, entries=None,
+                                  generation=_CRONTAB_CACHE['generation'] + 1)
+
+# Plain-text logs that receive cron's syslog lines, in order of preference
+CRON_LOG_FILES = ('/var/log/cron.log', '/var/log/syslog')
+
+# How much of the end of the log is scanned for recent activity
+CRON_LOG_TAIL_BYTES = 65536
+
+@functools.lru_cache(maxsize=None)
+def _cron_log_file():
+    """First readable cron log file, or None to use journalctl (probed once)"""
+    for path in CRON_LOG_FILES:
+        if os.access(path, os.R_OK):
+            return path
+    return None
+
+# Tail position in the activity log and the CRON lines seen so far, so each
+# poll only reads what was appended since the last one
+_ACTIVITY_STATE = {'inode': None, 'offset': 0, 'ring': collections.deque(maxlen=15)}
+_ACTIVITY_LOCK = threading.Lock()
+
+def read_log_tail(path):
+    """Return the most recent CRON lines of a log file, reading only new bytes"""
+    state = _ACTIVITY_STATE
+    with _ACTIVITY_LOCK:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            skip_partial = False
+            if (st.st_ino != state['inode'] or st.st_size < state['offset']
+                    or st.st_size - state['offset'] > CRON_LOG_TAIL_BYTES):
+                # First read, rotation, truncation, or more new data than the
+                # ring could hold: start again near the end
+                state['inode'] = st.st_ino
+                state['offset'] = max(0, st.st_size - CRON_LOG_TAIL_BYTES)
+                state['ring'].clear()
+                skip_partial = state['offset'] > 0
+            data = os.pread(fd, st.st_size - state['offset'], state['offset'])
+        finally:
+            os.close(fd)
         
-        return next_runs[:count]
+        # Leave a line that is still being written for the next poll
+        end = data.rfind(b'\n') + 1
+        state['offset'] += end
+        lines = data[:end].splitlines()
+        if skip_partial:
+            # The first line was most likely cut in half by the seek
+            lines = lines[1:]
+        state['ring'].extend(line.decode(errors='replace') for line in lines if b'CRON' in line)
+        return list(state['ring'])
+
+# The last journalctl result, reused for JOURNAL_CACHE_TTL seconds so open
+# dashboards and event streams share one journalctl run per period
+_JOURNAL_CACHE = {'expires': 0, 'lines': None}
+JOURNAL_CACHE_TTL = 10
+
+def read_journal_tail():
+    """Return the most recent CRON lines from the journal (cached for a few seconds)"""
+    now = time.monotonic()
+    with _ACTIVITY_LOCK:
+        if now < _JOURNAL_CACHE['expires']:
+            return _JOURNAL_CACHE['lines']
+        try:
+            result = subprocess.run(['journalctl', '-u', 'cron', '-n', '20', '--no-pager'],
+                                    capture_output=True, text=True, check=True)
+            lines = [line for line in result.stdout.split('\n') if 'CRON' in line][-15:]
+        except (subprocess.CalledProcessError, OSError):
+            lines = []
+        _JOURNAL_CACHE.update(expires=now + JOURNAL_CACHE_TTL, lines=lines)
+        return lines
+
+# Responses smaller than this are sent uncompressed; gzip would barely help
+GZIP_MIN_SIZE = 1024
+
+# Seconds between change checks on an open event stream, and the longest it
+# stays silent before sending a keep-alive comment. A check only forks
+# (crontab -l, journalctl) when the shared TTL caches have expired.
+STREAM_POLL_INTERVAL = 2
+STREAM_HEARTBEAT = 30
 
 class CronMonitorServer(BaseHTTPRequestHandler):
-    def _send_headers(self, status=200, content_type='application/json'):
+    # Keep connections open between dashboard polls; every response must
+    # therefore carry a Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Responses are small and written in one go; with Nagle on they can wait
+    # for the client's delayed ACK before leaving
+    disable_nagle_algorithm = True
+
+    def _send_headers(self, status=200, content_type='application/json', content_length=None, headers=None):
         self.send_response(status)
         self.send_header('Content-type', content_type)
+        if content_length is not None:
+            self.send_header('Content-Length', str(content_length))
+        headers = headers or {}
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if self.close_connection and 'Connection' not in headers:
+            self.send_header('Connection', 'close')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, DELETE')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, If-None-Match')
+        self.send_header('Access-Control-Expose-Headers', 'ETag')
         self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
         self.send_header('Pragma', 'no-cache')
         self.send_header('Expires', '0')
         self.end_headers()
 
-    def do_GET(self):
-        if self.path == '/':
-            self._send_headers(200, 'text/html')
-            self.wfile.write(self.get_dashboard_html().encode())
-        
-        elif self.path == '/api/jobs':
-            self._send_headers(200)
-            jobs = self.get_cron_jobs()
-            self.wfile.write(json.dumps(jobs).encode())
+    def _accepts_gzip(self):
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+
+    def _send(self, status=200, body=b'', content_type='application/json', headers=None):
+        headers = dict(headers or {})
+        if len(body) >= GZIP_MIN_SIZE:
+            headers['Vary'] = 'Accept-Encoding'
+            if self._accepts_gzip():
+                # Level 1: most of the size win for a fraction of the CPU
+                body = gzip.compress(body, compresslevel=1, mtime=0)
+                headers['Content-Encoding'] = 'gzip'
+        self._send_headers(status, content_type, len(body), headers)
+        self.wfile.write(body)
+
+    def _send_tagged(self, body):
+        """Send a JSON body with an ETag, or 304 if the client already has it"""
+        # Weak tag: the same content may go out gzipped or not
+        etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if self.headers.get('If-None-Match') == etag:
+            self._send_headers(304, headers={'ETag': etag})
+            return
+        self._send(200, body, headers={'ETag': etag})
+
+    def serve_dashboard(self):
+        if self._accepts_gzip():
+            headers = {'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'}
+            self._send_headers(200, 'text/html', len(DASHBOARD_GZIP), headers)
+            self.wfile.write(DASHBOARD_GZIP)
+            return
+
+        self._send_headers(200, 'text/html', DASHBOARD_SIZE, {'Vary': 'Accept-Encoding'})
+        # Headers are already on the socket; copy the page in-kernel, with
+        # explicit offsets so concurrent requests can share the descriptor
+        out_fd = self.connection.fileno()
+        offset = 0
+        while offset < DASHBOARD_SIZE:
+            sent = os.sendfile(out_fd, DASHBOARD_FD, offset, DASHBOARD_SIZE - offset)
+            if not sent:
+                break
+            offset += sent
+
+    def serve_jobs(self):
+        jobs = self.get_cron_jobs()
+        self._send_tagged(json_dumps(jobs))
+
+    def serve_activity(self):
+        activity = self.get_cron_activity()
+        self._send_tagged(json_dumps(activity))
+
+    def _state_body(self):
+        return json_dumps({'jobs': self.get_cron_jobs(), 'activity': self.get_cron_activity()})
+
+    def serve_state(self):
+        self._send_tagged(self._state_body())
+
+    def serve_stream(self):
+        """Push the dashboard state as server-sent events whenever it changes"""
+        # The stream never ends on its own, so the connection cannot be reused
+        self.close_connection = True
+        self._send_headers(200, 'text/event-stream', headers={'Connection': 'close'})
+        last_body = None
+        idle = 0
+        try:
+            while True:
+                # Both sources are cheap to re-check: the crontab by mtime and
+                # the log by the bytes appended since the last look
+                body = self._state_body()
+                if body != last_body:
+                    self.wfile.write(b'data: ' + body + b'\n\n')
+                    last_body = body
+                    idle = 0
+                elif idle >= STREAM_HEARTBEAT:
+                    # Comment line; keeps proxies from timing out a quiet stream
+                    self.wfile.write(b': keep-alive\n\n')
+                    idle = 0
+                time.sleep(STREAM_POLL_INTERVAL)
+                idle += STREAM_POLL_INTERVAL
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def serve_preview(self, expression):
+        self._send(200, json_dumps(CronPreview.parse_cron(expression)))
+
+    def handle_add_job(self):
+        content_length = int(self.headers['Content-Length'])
+        post_data = self.rfile.read(content_length).decode()
+        data = json.loads(post_data)
         
-        elif self.path == '/api/activity':
-            self._send_headers(200)
-            activity = self.get_cron_activity()
-            self.wfile.write(json.dumps(activity).encode())
+        success = self.add_cron_job(data['schedule'], data['command'], data.get('comment', ''))
         
-        elif self.path.startswith('/api/preview/'):
-            expression = self.path.split('/')[-1].replace('%20', ' ').replace('%2A', '*')
-            self._send_headers(200)
-            preview = CronPreview.parse_cron(expression)
-            self.wfile.write(json.dumps(preview).encode())
+        self._send(200 if success else 500, json_dumps({'success': success}))
+
+    def handle_delete_job(self, job_index):
+        success = self.delete_cron_job(job_index)
         
+        self._send(200 if success else 500, json_dumps({'success': success}))
+
+    # Exact-path routes; parameterized routes are matched by prefix below
+    _GET_ROUTES = {
+        '/': serve_dashboard,
+        '/api/jobs': serve_jobs,
+        '/api/activity': serve_activity,
+        '/api/state': serve_state,
+        '/api/stream': serve_stream
+    }
+    _POST_ROUTES = {
+        '/api/jobs/add': handle_add_job
+    }
+
+    def _ignore_body(self):
+        """Close the connection after replying to a request whose body goes unread
+
+        On a kept-alive connection an unread body would be parsed as the next request.
+        """
+        if self.headers.get('Content-Length', '0') != '0' or 'Transfer-Encoding' in self.headers:
+            self.close_connection = True
+
+    def do_GET(self):
+        self._ignore_body()
+        handler = self._GET_ROUTES.get(self.path)
+        if handler:
+            handler(self)
+        elif self.path[:13] == '/api/preview/':
+            self.serve_preview(unquote(self.path[13:]))
         else:
-            self._send_headers(404)
+            self._send(404)
 
     def do_POST(self):
-        if self.path == '/api/jobs/add':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length).decode()
-            data = json.loads(post_data)
-            
-            success = self.add_cron_job(data['schedule'], data['command'], data.get('comment', ''))
-            
-            self._send_headers(200 if success else 500)
-            self.wfile.write(json.dumps({'success': success}).encode())
+        handler = self._POST_ROUTES.get(self.path)
+        if handler:
+            handler(self)
+        else:
+            self._ignore_body()
+            self._send(404)
 
     def do_DELETE(self):
-        if self.path.startswith('/api/jobs/'):
-            job_index = int(self.path.split('/')[-1])
-            success = self.delete_cron_job(job_index)
-            
-            self._send_headers(200 if success else 500)
-            self.wfile.write(json.dumps({'success': success}).encode())
+        self._ignore_body()
+        if self.path[:10] == '/api/jobs/':
+            self.handle_delete_job(int(self.path[10:]))
+        else:
+            self._send(404)
 
     def get_cron_jobs(self):
-        try:
-            result = subprocess.run(['crontab', '-l'], capture_output=True, text=True, check=True)
-            jobs = []
-            comment = ""
-            job_index = 0
-            
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                if not line:
-                    comment = ""
-                    continue
-                elif line.startswith('#'):
-                    comment = line[1:].strip()
-                elif line and not line.startswith('#'):
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        schedule = ' '.join(parts[:5])
-                        command = ' '.join(parts[5:])
-                        
-                        preview = CronPreview.parse_cron(schedule)
-                        
-                        jobs.append({
-                            'index': job_index,
-                            'schedule': schedule,
-                            'command': command,
-                            'comment': comment or 'Custom cron job',
-                            'full_line': line,
-                            'description': preview['description'],
-                            'next_runs': preview['next_runs'][:3]
-                        })
-                        job_index += 1
-                    comment = ""
-            
-            return jobs
-        except subprocess.CalledProcessError:
-            return []
+        entries = read_crontab_entries()
+        minute_bucket = int(time.time() // 60)
+        # Reuse the last payload while neither the crontab nor the minute changed
+        with _CRONTAB_LOCK:
+            if _JOBS_CACHE['entries'] is entries and _JOBS_CACHE['minute_bucket'] == minute_bucket:
+                return _JOBS_CACHE['jobs']
+        
+        jobs = []
+        for job_index, (schedule, command, comment, line) in enumerate(entries):
+            preview = CronPreview.parse_cron_brief(schedule, minute_bucket)
+            
+            jobs.append({
+                'index': job_index,
+                'schedule': schedule,
+                'command': command,
+                'comment': comment or 'Custom cron job',
+                'full_line': line,
+                'description': preview['description'],
+                'next_runs': preview['next_runs'][:3]
+            })
+        
+        with _CRONTAB_LOCK:
+            _JOBS_CACHE.update(entries=entries, minute_bucket=minute_bucket, jobs=jobs)
+        return jobs
 
     def add_cron_job(self, schedule, command, comment):
+        # A newline would smuggle extra lines into the crontab
+        if any(c in value for value in (schedule, command, comment) for c in '\r\n'):
+            return False
+        
+        # cron ignores the whole crontab if one line fails to parse, so only a
+        # schedule we can compile may skip crontab's own syntax check
+        parts = schedule.split()
+        checked = (len(parts) == 5 and command.strip() != ''
+                   and CronPreview._compiled_masks(tuple(parts))[0] is not None)
+        
         try:
-            current_jobs = []
-            try:
-                result = subprocess.run(['crontab', '-l'], capture_output=True, text=True, check=True)
-                current_jobs = result.stdout.strip().split('\n')
-            except subprocess.CalledProcessError:
-                pass
-            
-            if comment:
-                current_jobs.append(f"#{comment}")
-            current_jobs.append(f"{schedule} {command}")
-            
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.cron') as f:
-                f.write('\n'.join(current_jobs) + '\n')
-                temp_file = f.name
-            
-            subprocess.run(['crontab', temp_file], check=True)
-            os.unlink(temp_file)
-            return True
+            with crontab_edit_lock():
+                data, _ = read_crontab()
+                current_jobs = data.strip().split(b'\n') if data.strip() else []
+                
+                if comment:
+                    current_jobs.append(f"#{comment}".encode())
+                current_jobs.append(f"{schedule} {command}".encode())
+                
+                write_crontab(current_jobs, direct=checked)
+                return True
             
         except Exception as e:
             print(f"Error adding cron job: {e}")
@@ -331,30 +926,46 @@ class CronMonitorServer(BaseHTTPRequestHandler):
 
     def delete_cron_job(self, job_index):
         try:
-            result = subprocess.run(['crontab', '-l'], capture_output=True, text=True, check=True)
-            lines = result.stdout.strip().split('\n')
-            
-            filtered_lines = []
-            current_job_index = 0
-            
-            for i, line in enumerate(lines):
-                if line.strip() and not line.startswith('#'):
-                    if current_job_index == job_index:
-                        if i > 0 and lines[i-1].strip().startswith('#'):
-                            filtered_lines = filtered_lines[:-1]
-                        current_job_index += 1
+            with crontab_edit_lock():
+                data, _ = read_crontab()
+                if not data.strip():
+                    return False
+                lines = data.strip().split(b'\n')
+                
+                # Single pass: a comment is held back until we know whether
+                # the job it describes is the one being deleted
+                filtered_lines = []
+                pending_comment = None
+                current_job_index = 0
+                deleted = False
+                
+                for line in lines:
+                    match = _CRONTAB_RE.match(line)
+                    if match.group(1) is not None:
+                        if pending_comment is not None:
+                            filtered_lines.append(pending_comment)
+                        pending_comment = line
                         continue
-                    current_job_index += 1
+                    if match.group(2) is not None:
+                        if current_job_index == job_index:
+                            current_job_index += 1
+                            pending_comment = None
+                            deleted = True
+                            continue
+                        current_job_index += 1
+                    
+                    if pending_comment is not None:
+                        filtered_lines.append(pending_comment)
+                        pending_comment = None
+                    filtered_lines.append(line)
                 
-                filtered_lines.append(line)
-            
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.cron') as f:
-                f.write('\n'.join(filtered_lines) + '\n')
-                temp_file = f.name
-            
-            subprocess.run(['crontab', temp_file], check=True)
-            os.unlink(temp_file)
-            return True
+                if not deleted:
+                    return False
+                if pending_comment is not None:
+                    filtered_lines.append(pending_comment)
+                
+                write_crontab(filtered_lines)
+                return True
             
         except Exception as e:
             print(f"Error deleting cron job: {e}")
@@ -362,735 +973,39 @@ class CronMonitorServer(BaseHTTPRequestHandler):
 
     def get_cron_activity(self):
         try:
-            commands = [
-                ['journalctl', '-u', 'cron', '-n', '20', '--no-pager'],
-                ['tail', '-20', '/var/log/cron.log'],
-                ['tail', '-20', '/var/log/syslog']
-            ]
-            
-            for cmd in commands:
-                try:
-                    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                    lines = [line for line in result.stdout.split('\n') if 'CRON' in line][-15:]
-                    if lines:
-                        return lines
-                except subprocess.CalledProcessError:
-                    continue
+            log_file = _cron_log_file()
+            if log_file:
+                lines = read_log_tail(log_file)
+            else:
+                lines = read_journal_tail()
             
-            return ["No cron activity found in logs"]
+            return lines or ["No cron activity found in logs"]
         except Exception:
             return ["Error reading cron logs"]
 
-    def get_dashboard_html(self):
-        return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Pi Cron Monitor</title>
-    <style>
-        :root {
-            --primary-color: #007AFF;
-            --secondary-color: #5856D6;
-            --success-color: #34C759;
-            --warning-color: #FF9500;
-            --danger-color: #FF3B30;
-            --background: #F2F2F7;
-            --surface: #FFFFFF;
-            --surface-secondary: #F2F2F7;
-            --text-primary: #000000;
-            --text-secondary: #8E8E93;
-            --border-color: #C6C6C8;
-            --shadow: 0 1px 3px rgba(0,0,0,0.1);
-            --shadow-large: 0 4px 16px rgba(0,0,0,0.1);
-            --border-radius: 12px;
-            --border-radius-large: 16px;
-            --transition: all 0.2s cubic-bezier(0.25, 0.46, 0.45, 0.94);
-        }
-
-        * { 
-            box-sizing: border-box; margin: 0; padding: 0;
-            -webkit-font-smoothing: antialiased; text-rendering: optimizeLegibility;
-        }
-
-        body { 
-            font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Helvetica Neue', sans-serif;
-            background: var(--background); color: var(--text-primary); line-height: 1.5;
-            font-size: 16px; overflow-x: hidden;
-        }
-
-        .container { 
-            max-width: 1200px; margin: 0 auto; padding: 20px;
-            min-height: 100vh;
-        }
-
-        .header {
-            text-align: center; margin-bottom: 32px;
-            animation: slideDown 0.6s cubic-bezier(0.25, 0.46, 0.45, 0.94);
-        }
-
-        .header h1 { 
-            font-size: 2.5rem; font-weight: 700; margin-bottom: 8px;
-            background: linear-gradient(135deg, var(--primary-color), var(--secondary-color));
-            -webkit-background-clip: text; -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-
-        .header p { 
-            font-size: 1.1rem; color: var(--text-secondary); font-weight: 400;
-        }
-
-        .stats-bar {
-            display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 16px; margin-bottom: 24px;
-        }
-
-        .stat-card {
-            background: var(--surface); padding: 20px; border-radius: var(--border-radius);
-            box-shadow: var(--shadow); border: 1px solid var(--border-color);
-            text-align: center; transition: var(--transition);
-        }
-
-        .stat-card:hover { transform: translateY(-2px); box-shadow: var(--shadow-large); }
-
-        .stat-number { 
-            font-size: 2rem; font-weight: 700; margin-bottom: 4px;
-            color: var(--primary-color);
-        }
-
-        .stat-label { 
-            font-size: 0.9rem; color: var(--text-secondary); font-weight: 500;
-        }
-
-        .card {
-            background: var(--surface); border-radius: var(--border-radius-large);
-            box-shadow: var(--shadow); border: 1px solid var(--border-color);
-            margin-bottom: 24px; overflow: hidden; transition: var(--transition);
-            animation: slideUp 0.6s cubic-bezier(0.25, 0.46, 0.45, 0.94);
-        }
-
-        .card-header {
-            padding: 24px 24px 0; display: flex; justify-content: space-between;
-            align-items: center; border-bottom: none;
-        }
-
-        .card-title { 
-            font-size: 1.5rem; font-weight: 700; color: var(--text-primary);
-            display: flex; align-items: center; gap: 8px;
-        }
-
-        .card-content { padding: 24px; }
-
-        .form-section {
-            background: var(--surface-secondary); border-radius: var(--border-radius);
-            padding: 24px; margin-bottom: 24px; display: none;
-            border: 2px solid var(--primary-color); animation: fadeIn 0.3s ease;
-        }
-
-        .form-title { 
-            font-size: 1.25rem; font-weight: 600; margin-bottom: 20px;
-            color: var(--primary-color);
-        }
-
-        .form-grid {
-            display: grid; grid-template-columns: 1fr 2fr 1fr; gap: 16px;
-            margin-bottom: 20px;
-        }
-
-        @media (max-width: 768px) { 
-            .form-grid { grid-template-columns: 1fr; }
-        }
-
-        .form-group { display: flex; flex-direction: column; }
-
-        .form-label { 
-            font-weight: 600; margin-bottom: 6px; color: var(--text-primary);
-            font-size: 0.9rem;
-        }
-
-        .form-input {
-            padding: 12px 16px; border: 1.5px solid var(--border-color); 
-            border-radius: 10px; font-size: 1rem; transition: var(--transition);
-            background: var(--surface); font-family: 'SF Mono', Monaco, monospace;
-        }
-
-        .form-input:focus { 
-            outline: none; border-color: var(--primary-color);
-            box-shadow: 0 0 0 3px rgba(0, 122, 255, 0.1);
-        }
-
-        .cron-preview {
-            background: var(--surface); border: 1.5px solid var(--success-color);
-            border-radius: var(--border-radius); padding: 20px; margin-top: 16px;
-            display: none; animation: slideDown 0.3s ease;
-        }
-
-        .cron-preview.invalid { border-color: var(--danger-color); }
-
-        .preview-title { 
-            font-weight: 700; margin-bottom: 12px; color: var(--success-color);
-            display: flex; align-items: center; gap: 6px;
-        }
-
-        .cron-preview.invalid .preview-title { color: var(--danger-color); }
-
-        .preview-description { 
-            font-size: 1.1rem; font-weight: 600; margin-bottom: 8px;
-            color: var(--text-primary);
-        }
-
-        .preview-explanation { 
-            font-size: 0.95rem; color: var(--text-secondary); margin-bottom: 12px;
-        }
-
-        .preview-breakdown {
-            display: grid; grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
-            gap: 8px; margin-bottom: 12px;
-        }
-
-        .breakdown-item {
-            background: var(--surface-secondary); padding: 8px; border-radius: 8px;
-            text-align: center; font-size: 0.8rem;
-        }
-
-        .breakdown-label { font-weight: 600; color: var(--text-secondary); }
-        .breakdown-value { color: var(--text-primary); margin-top: 2px; }
-
-        .preview-next-runs { 
-            font-size: 0.9rem; color: var(--text-secondary);
-            background: var(--surface-secondary); padding: 12px; border-radius: 8px;
-        }
-
-        .btn {
-            padding: 12px 20px; border: none; border-radius: 10px; cursor: pointer;
-            font-size: 1rem; font-weight: 600; transition: var(--transition);
-            text-decoration: none; display: inline-block; text-align: center;
-            font-family: inherit;
-        }
-
-        .btn-primary { 
-            background: var(--primary-color); color: white;
-        }
-        .btn-primary:hover { 
-            background: #0056D2; transform: translateY(-1px);
-        }
-
-        .btn-secondary { 
-            background: var(--text-secondary); color: white;
-        }
-        .btn-secondary:hover { background: #6D6D72; }
-
-        .btn-danger { 
-            background: var(--danger-color); color: white;
-        }
-        .btn-danger:hover { 
-            background: #D70015; transform: translateY(-1px);
-        }
-
-        .btn-success { 
-            background: var(--success-color); color: white;
-        }
-        .btn-success:hover { background: #248A3D; }
-
-        .cron-job {
-            background: var(--surface); border: 1px solid var(--border-color);
-            border-radius: var(--border-radius); padding: 20px; margin: 12px 0;
-            border-left: 4px solid var(--success-color); transition: var(--transition);
-        }
-
-        .cron-job:hover { 
-            transform: translateY(-2px); box-shadow: var(--shadow-large);
-        }
-
-        .job-header {
-            display: flex; justify-content: space-between; align-items: flex-start;
-            margin-bottom: 16px;
-        }
-
-        .job-title { 
-            font-size: 1.2rem; font-weight: 700; color: var(--primary-color);
-            margin-bottom: 4px;
-        }
-
-        .job-description { 
-            font-size: 1rem; color: var(--text-secondary); margin-bottom: 12px;
-        }
-
-        .job-details {
-            display: grid; grid-template-columns: 1fr 2fr; gap: 12px;
-            margin-bottom: 12px;
-        }
-
-        .job-schedule {
-            font-family: 'SF Mono', Monaco, monospace; font-size: 0.9rem;
-            background: var(--surface-secondary); padding: 8px 12px;
-            border-radius: 8px; color: var(--text-primary); font-weight: 600;
-        }
-
-        .job-command {
-            font-family: 'SF Mono', Monaco, monospace; font-size: 0.9rem;
-            background: var(--surface-secondary); padding: 8px 12px;
-            border-radius: 8px; color: var(--text-primary); word-break: break-all;
-        }
-
-        .job-next-runs {
-            font-size: 0.85rem; color: var(--text-secondary);
-            background: rgba(255, 193, 7, 0.1); padding: 8px 12px;
-            border-radius: 8px; margin-bottom: 12px;
-        }
-
-        .activity-log {
-            background: #1C1C1E; color: #00FF41; padding: 20px;
-            border-radius: var(--border-radius); font-family: 'SF Mono', Monaco, monospace;
-            font-size: 0.85rem; line-height: 1.6; max-height: 400px; overflow-y: auto;
-        }
-
-        .activity-log::-webkit-scrollbar { width: 8px; }
-        .activity-log::-webkit-scrollbar-track { background: #2C2C2E; }
-        .activity-log::-webkit-scrollbar-thumb { background: #48484A; border-radius: 4px; }
-
-        .empty-state {
-            text-align: center; padding: 48px; color: var(--text-secondary);
-            background: var(--surface-secondary); border-radius: var(--border-radius);
-        }
-
-        .empty-icon { font-size: 3rem; margin-bottom: 16px; }
-
-        .progress-bar {
-            position: fixed; top: 0; left: 0; width: 100%; height: 3px; z-index: 1000;
-            background: rgba(0, 122, 255, 0.1);
-        }
-
-        .progress-fill {
-            height: 100%; background: linear-gradient(90deg, var(--success-color), var(--primary-color));
-            width: 0%; transition: width 0.1s linear;
-        }
-
-        .status-indicator {
-            display: inline-block; width: 8px; height: 8px; border-radius: 50%;
-            background: var(--success-color); margin-right: 6px;
-            animation: pulse 2s infinite;
-        }
-
-        @keyframes slideDown {
-            from { opacity: 0; transform: translateY(-20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        @keyframes slideUp {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        @keyframes fadeIn {
-            from { opacity: 0; }
-            to { opacity: 1; }
-        }
-
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-
-        .updating { opacity: 0.8; transition: opacity 0.3s ease; }
-
-        @media (max-width: 768px) {
-            .container { padding: 16px; }
-            .header h1 { font-size: 2rem; }
-            .job-details { grid-template-columns: 1fr; }
-            .stats-bar { grid-template-columns: 1fr; }
-        }
-    </style>
-</head>
-<body>
-    <div class="progress-bar">
-        <div class="progress-fill" id="progressBar"></div>
-    </div>
-
-    <div class="container">
-        <div class="header">
-            <h1>Pi Cron Monitor</h1>
-            <p>Modern cron job management with live preview</p>
-        </div>
-
-        <div class="stats-bar">
-            <div class="stat-card">
-                <div class="stat-number" id="jobCount">0</div>
-                <div class="stat-label">Active Jobs</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number" id="activityCount">0</div>
-                <div class="stat-label">Recent Events</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number" id="refreshCounter">10</div>
-                <div class="stat-label">Next Refresh (s)</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">
-                    <span class="status-indicator"></span>Online
-                </div>
-                <div class="stat-label">System Status</div>
-            </div>
-        </div>
-
-        <div class="card">
-            <div class="card-header">
-                <h2 class="card-title">📋 Cron Jobs</h2>
-                <button class="btn btn-primary" onclick="toggleAddForm()">
-                    + Add New Job
-                </button>
-            </div>
-            <div class="card-content">
-                <div class="form-section" id="addJobForm">
-                    <h3 class="form-title">Add New Cron Job</h3>
-                    <form id="cronForm">
-                        <div class="form-grid">
-                            <div class="form-group">
-                                <label class="form-label">Schedule</label>
-                                <input type="text" class="form-input" id="cronSchedule" 
-                                       placeholder="* * * * *" value="* * * * *" required>
-                                <small style="color: var(--text-secondary); margin-top: 4px;">
-                                    Format: minute hour day month weekday
-                                </small>
-                            </div>
-                            <div class="form-group">
-                                <label class="form-label">Command</label>
-                                <input type="text" class="form-input" id="cronCommand" 
-                                       placeholder="/path/to/script.sh" required>
-                            </div>
-                            <div class="form-group">
-                                <label class="form-label">Description</label>
-                                <input type="text" class="form-input" id="cronComment" 
-                                       placeholder="Daily backup task">
-                            </div>
-                        </div>
-                        
-                        <div class="cron-preview" id="cronPreview">
-                            <div class="preview-title" id="previewTitle">
-                                ✅ Schedule Preview
-                            </div>
-                            <div class="preview-description" id="previewDescription"></div>
-                            <div class="preview-explanation" id="previewExplanation"></div>
-                            
-                            <div class="preview-breakdown" id="previewBreakdown"></div>
-                            
-                            <div class="preview-next-runs" id="previewNextRuns"></div>
-                        </div>
-                        
-                        <div style="margin-top: 20px;">
-                            <button type="submit" class="btn btn-success">Add Cron Job</button>
-                            <button type="button" class="btn btn-secondary" onclick="toggleAddForm()" 
-                                    style="margin-left: 12px;">Cancel</button>
-                        </div>
-                    </form>
-                </div>
-                
-                <div id="cronJobsList">
-                    <div class="empty-state">
-                        <div class="empty-icon">⏰</div>
-                        <div><strong>Loading cron jobs...</strong></div>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <div class="card">
-            <div class="card-header">
-                <h2 class="card-title">📈 Recent Activity</h2>
-            </div>
-            <div class="card-content">
-                <div class="activity-log" id="activityLog">
-                    <div style="color: #8E8E93;">Loading recent activity...</div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        let refreshInterval;
-        let countdown = 10;
-        let previewTimeout;
-        
-        // Apple-style smooth animations
-        function animateValue(element, start, end, duration, callback) {
-            const startTime = performance.now();
-            const animate = (currentTime) => {
-                const elapsed = currentTime - startTime;
-                const progress = Math.min(elapsed / duration, 1);
-                const easeProgress = 1 - Math.pow(1 - progress, 3); // Ease out cubic
-                
-                const current = start + (end - start) * easeProgress;
-                callback(current);
-                
-                if (progress < 1) {
-                    requestAnimationFrame(animate);
-                }
-            };
-            requestAnimationFrame(animate);
-        }
-        
-        function startCountdown() {
-            countdown = 10;
-            const progressBar = document.getElementById('progressBar');
-            const counter = document.getElementById('refreshCounter');
-            
-            const countdownInterval = setInterval(() => {
-                countdown--;
-                const progress = ((10 - countdown) / 10) * 100;
-                
-                animateValue(progressBar, parseFloat(progressBar.style.width) || 0, progress, 100, 
-                    (value) => progressBar.style.width = value + '%');
-                
-                counter.textContent = countdown;
-                
-                if (countdown <= 0) {
-                    clearInterval(countdownInterval);
-                    setTimeout(() => {
-                        progressBar.style.width = '0%';
-                    }, 300);
-                }
-            }, 1000);
-        }
-        
-        async function updateCronPreview() {
-            const schedule = document.getElementById('cronSchedule').value.trim();
-            const preview = document.getElementById('cronPreview');
-            
-            if (!schedule) {
-                preview.style.display = 'none';
-                return;
-            }
-            
-            try {
-                const response = await fetch(`/api/preview/${encodeURIComponent(schedule)}`);
-                const data = await response.json();
-                
-                preview.style.display = 'block';
-                preview.className = 'cron-preview ' + (data.valid ? '' : 'invalid');
-                
-                document.getElementById('previewTitle').innerHTML = 
-                    data.valid ? '✅ Schedule Preview' : '❌ Invalid Expression';
-                
-                document.getElementById('previewDescription').textContent = data.description;
-                document.getElementById('previewExplanation').textContent = data.explanation;
-                
-                // Show breakdown
-                const breakdown = document.getElementById('previewBreakdown');
-                if (data.breakdown) {
-                    breakdown.innerHTML = Object.entries(data.breakdown).map(([key, value]) => `
-                        <div class="breakdown-item">
-                            <div class="breakdown-label">${key}</div>
-                            <div class="breakdown-value">${value}</div>
-                        </div>
-                    `).join('');
-                }
-                
-                // Show next runs
-                const nextRuns = document.getElementById('previewNextRuns');
-                if (data.next_runs && data.next_runs.length > 0) {
-                    nextRuns.innerHTML = `<strong>Next runs:</strong><br>${data.next_runs.join('<br>')}`;
-                } else {
-                    nextRuns.innerHTML = '<strong>Unable to calculate next runs</strong>';
-                }
-                
-            } catch (error) {
-                preview.style.display = 'none';
-            }
-        }
-        
-        // Real-time preview with Apple-style responsiveness
-        document.getElementById('cronSchedule').addEventListener('input', () => {
-            clearTimeout(previewTimeout);
-            previewTimeout = setTimeout(updateCronPreview, 150); // Faster response
-        });
-        
-        async function loadCronJobs() {
-            try {
-                const response = await fetch('/api/jobs');
-                const jobs = await response.json();
-                const container = document.getElementById('cronJobsList');
-                document.getElementById('jobCount').textContent = jobs.length;
-                
-                if (jobs.length === 0) {
-                    container.innerHTML = `
-                        <div class="empty-state">
-                            <div class="empty-icon">📝</div>
-                            <div><strong>No cron jobs found</strong></div>
-                            <div style="margin-top: 8px;">Add jobs using the form above or <code>crontab -e</code></div>
-                        </div>
-                    `;
-                    return;
-                }
-                
-                container.innerHTML = jobs.map(job => `
-                    <div class="cron-job">
-                        <div class="job-header">
-                            <div>
-                                <div class="job-title">${job.comment}</div>
-                                <div class="job-description">${job.description}</div>
-                            </div>
-                            <button class="btn btn-danger" onclick="deleteCronJob(${job.index})" 
-                                    title="Delete job">Delete</button>
-                        </div>
-                        <div class="job-details">
-                            <div class="job-schedule">${job.schedule}</div>
-                            <div class="job-command">${job.command}</div>
-                        </div>
-                        <div class="job-next-runs">
-                            <strong>Next runs:</strong> ${job.next_runs.join(', ') || 'Unable to calculate'}
-                        </div>
-                    </div>
-                `).join('');
-                
-            } catch (error) {
-                console.error('Error loading cron jobs:', error);
-            }
-        }
-        
-        async function loadActivity() {
-            try {
-                const response = await fetch('/api/activity');
-                const activity = await response.json();
-                const logElement = document.getElementById('activityLog');
-                document.getElementById('activityCount').textContent = activity.length;
-                
-                if (activity.length === 0 || activity[0].includes('No cron activity')) {
-                    logElement.innerHTML = '<div style="color: #8E8E93;">No recent cron activity found</div>';
-                    return;
-                }
-                
-                logElement.innerHTML = activity.slice(-20).map(line => {
-                    if (line.includes('CMD')) {
-                        return `<div style="color: #34C759;">→ ${line}</div>`;
-                    } else if (line.includes('RELOAD')) {
-                        return `<div style="color: #007AFF;">⟲ ${line}</div>`;
-                    } else {
-                        return `<div style="color: #FF9500;">• ${line}</div>`;
-                    }
-                }).join('');
-                
-            } catch (error) {
-                console.error('Error loading activity:', error);
-            }
-        }
-        
-        async function refreshData() {
-            document.querySelector('.container').classList.add('updating');
-            
-            await Promise.all([
-                loadCronJobs(),
-                loadActivity()
-            ]);
-            
-            setTimeout(() => {
-                document.querySelector('.container').classList.remove('updating');
-            }, 200);
-        }
-        
-        function toggleAddForm() {
-            const form = document.getElementById('addJobForm');
-            const isVisible = form.style.display !== 'none';
-            
-            form.style.display = isVisible ? 'none' : 'block';
-            
-            if (!isVisible) {
-                document.getElementById('cronSchedule').focus();
-                updateCronPreview(); // Show initial preview
-            }
-        }
-        
-        async function deleteCronJob(jobIndex) {
-            if (!confirm('Are you sure you want to delete this cron job?')) {
-                return;
-            }
-            
-            try {
-                const response = await fetch(`/api/jobs/${jobIndex}`, {
-                    method: 'DELETE'
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    refreshData();
-                } else {
-                    alert('Failed to delete cron job.');
-                }
-            } catch (error) {
-                console.error('Error deleting cron job:', error);
-                alert('Error deleting cron job.');
-            }
-        }
-        
-        document.getElementById('cronForm').addEventListener('submit', async (e) => {
-            e.preventDefault();
-            
-            const schedule = document.getElementById('cronSchedule').value;
-            const command = document.getElementById('cronCommand').value;
-            const comment = document.getElementById('cronComment').value;
-            
-            try {
-                const response = await fetch('/api/jobs/add', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ schedule, command, comment })
-                });
-                
-                const result = await response.json();
-                
-                if (result.success) {
-                    toggleAddForm();
-                    document.getElementById('cronForm').reset();
-                    document.getElementById('cronSchedule').value = '* * * * *'; // Reset to default
-                    document.getElementById('cronPreview').style.display = 'none';
-                    refreshData();
-                } else {
-                    alert('Failed to add cron job. Please check your input.');
-                }
-            } catch (error) {
-                console.error('Error adding cron job:', error);
-                alert('Error adding cron job.');
-            }
-        });
-        
-        function startAutoRefresh() {
-            refreshData();
-            startCountdown();
-            
-            refreshInterval = setInterval(() => {
-                refreshData();
-                startCountdown();
-            }, 10000);
-        }
-        
-        // Tab visibility optimization
-        document.addEventListener('visibilitychange', () => {
-            if (document.hidden) {
-                clearInterval(refreshInterval);
-            } else {
-                startAutoRefresh();
-            }
-        });
-        
-        // Initialize
-        startAutoRefresh();
-        updateCronPreview(); // Show initial preview for default value
-        
-        // Cleanup
-        window.addEventListener('beforeunload', () => {
-            clearInterval(refreshInterval);
-            clearTimeout(previewTimeout);
-        });
-    </script>
-</body>
-</html>'''
+# The dashboard is served straight from disk with os.sendfile; the descriptor
+# stays open for the life of the server
+DASHBOARD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.html')
+DASHBOARD_FD = os.open(DASHBOARD_PATH, os.O_RDONLY)
+DASHBOARD_SIZE = os.fstat(DASHBOARD_FD).st_size
+# Browsers almost always accept gzip, so the compressed page is built once at
+# startup; compressing a static page at the highest level is a one-time cost
+DASHBOARD_GZIP = gzip.compress(os.pread(DASHBOARD_FD, DASHBOARD_SIZE, 0), compresslevel=9, mtime=0)
+
+class CronHTTPServer(ThreadingHTTPServer):
+    # One thread per connection; kept-alive dashboard connections must not
+    # hold up shutdown
+    daemon_threads = True
+    # Several tabs reconnecting at once overflow the default backlog of 5
+    request_queue_size = 32
 
 if __name__ == '__main__':
-    server = HTTPServer(('0.0.0.0', 8088), CronMonitorServer)
+    server = CronHTTPServer(('0.0.0.0', 8088), CronMonitorServer)
     print("🍎 Apple-Style Pi Cron Monitor running at http://localhost:8088")
     print("   Optimized for performance with live cron preview")
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\n⏹️  Server stopped")
+    finally:
+        server.server_close()